@@ -1,5 +1,7 @@
 """CodeQL analysis domain entities."""
 
+import os
+import stat
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -82,10 +84,13 @@ class CodeQLAnalysisRequest:
 
     def __post_init__(self) -> None:
         """Validate analysis request."""
-        if not self.repository_path.exists():
+        # A single stat answers both checks
+        try:
+            repository_stat = os.stat(self.repository_path)
+        except (FileNotFoundError, NotADirectoryError):
             raise ValueError(f"Repository path does not exist: {self.repository_path}")
 
-        if not self.repository_path.is_dir():
+        if not stat.S_ISDIR(repository_stat.st_mode):
             raise ValueError(
                 f"Repository path must be a directory: {self.repository_path}"
             )
@@ -1,10 +1,13 @@
 """CodeQL analysis use case implementation."""
 
 import json
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Any, List, Optional, Set
+from types import MappingProxyType
+from typing import AbstractSet, Any, List, Optional, Set, Tuple
 
 from ..entities.codeql_analysis import (
     CodeQLAnalysisRequest,
@@ -15,10 +18,13 @@ from ..entities.codeql_analysis import (
     RepositoryAnalysisSummary,
     AnalysisStatus,
 )
-from ...infrastructure.language_detector import LanguageDetector, LanguageType
+from ...infrastructure.language_detector import LanguageDetector
 from ...infrastructure.codeql_installer import CodeQLInstaller
 from ...infrastructure.codeql_runner import CodeQLRunner
-from ...infrastructure.system_resource_manager import SystemResourceManager
+from ...infrastructure.system_resource_manager import (
+    SystemResourceManager,
+    get_cpu_count,
+)
 from ...infrastructure.logger import configure_logging, get_logger
 from ...infrastructure.git_utils import GitUtils
 
@@ -33,6 +39,28 @@ from ...infrastructure.logger import (
 class CodeQLAnalysisUseCase:
     """Use case for running CodeQL analysis on repositories."""
 
+    # Map detected languages to CodeQL languages
+    LANGUAGE_MAPPING = MappingProxyType(
+        {
+            "javascript": CodeQLLanguage.JAVASCRIPT,
+            "typescript": CodeQLLanguage.TYPESCRIPT,
+            "python": CodeQLLanguage.PYTHON,
+            "java": CodeQLLanguage.JAVA,
+            "csharp": CodeQLLanguage.CSHARP,
+            "cpp": CodeQLLanguage.CPP,
+            "go": CodeQLLanguage.GO,
+            "ruby": CodeQLLanguage.RUBY,
+            "swift": CodeQLLanguage.SWIFT,
+            "actions": CodeQLLanguage.ACTIONS,
+        }
+    )
+
+    # Define which languages are compiled vs non-compiled
+    COMPILED_LANGUAGES = frozenset({"java", "csharp", "cpp", "swift"})
+    NON_COMPILED_LANGUAGES = frozenset(
+        {"javascript", "typescript", "python", "go", "ruby", "actions"}
+    )
+
     def __init__(self, logger: Any) -> None:
         """Initialize the use case with dependencies."""
         self._logger = get_logger(__name__)
@@ -379,11 +407,18 @@ class CodeQLAnalysisUseCase:
         git_utils = GitUtils(Path(request.repository_path))
         changed_files = git_utils.get_diff_files(request.git_info)
 
-        # Log changed files if any
-        for file in changed_files:
-            self._logger.debug(f"Changed file: {file}")
+        # Log changed files if any; skip the loop entirely unless debugging
+        if self._logger.isEnabledFor(logging.DEBUG):
+            for file in changed_files:
+                self._logger.debug("Changed file: %s", file)
+
+        # Index once instead of scanning every changed file per project
+        changed_paths = self._get_changed_paths(changed_files)
 
-        if isMonorepo:
+        if isMonorepo and request.only_changed_files and not changed_paths:
+            # No project can contain a changed file, so skip detecting them
+            self._logger.info("No changed files found, skipping project detection")
+        elif isMonorepo:
             if configData:
                 projects_config = configData.get("projects", [])
                 project_index = 0
@@ -393,7 +428,8 @@ class CodeQLAnalysisUseCase:
                     "(.codeql.json) WILL BE SKIPPED!"
                 )
 
-                for config_index, project in enumerate(projects_config):
+                config_candidates = []
+                for project in projects_config:
                     project_path = Path(
                         request.git_info.working_dir, project.get("path", "")
                     )
@@ -402,26 +438,30 @@ class CodeQLAnalysisUseCase:
                     if (
                         request.only_changed_files
                         and not self._project_has_changed_files(
-                            project_path, request.git_info.working_dir, changed_files
+                            project_path, request.git_info.working_dir, changed_paths
                         )
                     ):
                         self._logger.debug(
-                            f"Skipping project {project_path} - no changed files"
+                            "Skipping project %s - no changed files", project_path
                         )
                         continue
 
-                    # Detect languages first to check if this is a valid project
-                    non_compiled_languages = self._detect_languages(
-                        project_path, LanguageType.NON_COMPILED
-                    )
-                    compiled_languages = self._detect_languages(
-                        project_path, LanguageType.COMPILED
-                    )
+                    config_candidates.append((project, project_path))
+
+                # Detect languages first to check if these are valid projects
+                config_languages = self._detect_projects_languages(
+                    [project_path for _, project_path in config_candidates]
+                )
 
+                for (project, project_path), (
+                    non_compiled_languages,
+                    compiled_languages,
+                ) in zip(config_candidates, config_languages):
                     # Skip if no supported languages are detected
                     if not non_compiled_languages and not compiled_languages:
                         self._logger.debug(
-                            f"Skipping project {project_path.name} - no supported languages detected"
+                            "Skipping project %s - no supported languages detected",
+                            project_path.name,
                         )
                         continue
 
@@ -452,62 +492,79 @@ class CodeQLAnalysisUseCase:
                     project_index += 1
             else:
                 project_index = 0
-                for folder in request.repository_path.iterdir():
-                    if folder.is_dir():
+                folder_candidates = []
+                # Directory entries carry their type, so no stat per folder
+                with os.scandir(request.repository_path) as entries:
+                    for entry in entries:
+                        if not entry.is_dir():
+                            continue
+
+                        # Skip folders the language detector would not scan
+                        # either, such as .git and node_modules
+                        if not self._language_detector.should_scan_directory(
+                            entry.name
+                        ):
+                            self._logger.debug(
+                                "Skipping project %s - ignored directory", entry.name
+                            )
+                            continue
+
+                        folder = Path(entry.path)
                         project_name = folder.name or folder.resolve().name
 
                         # Skip project if filtering by changed files and no changes in this project
                         if (
                             request.only_changed_files
                             and not self._project_has_changed_files(
-                                folder, request.repository_path, changed_files
+                                folder, request.repository_path, changed_paths
                             )
                         ):
                             self._logger.debug(
-                                f"Skipping project {project_name} - no changed files"
+                                "Skipping project %s - no changed files", project_name
                             )
                             continue
 
-                        # Detect languages first to check if this is a valid project
-                        non_compiled_languages = self._detect_languages(
-                            folder, LanguageType.NON_COMPILED
-                        )
-                        compiled_languages = self._detect_languages(
-                            folder, LanguageType.COMPILED
-                        )
+                        folder_candidates.append((folder, project_name))
 
-                        # Skip if no supported languages are detected
-                        if not non_compiled_languages and not compiled_languages:
-                            self._logger.debug(
-                                f"Skipping project {project_name} - no supported languages detected"
-                            )
-                            continue
+                # Detect languages first to check if these are valid projects
+                folder_languages = self._detect_projects_languages(
+                    [folder for folder, _ in folder_candidates]
+                )
 
-                        projects.append(
-                            ProjectInfo(
-                                repository_path=request.repository_path,
-                                project_path=folder,
-                                build_mode="none",
-                                build_script=None,
-                                queries=[],
-                                name=project_name,
-                                non_compiled_languages=non_compiled_languages,
-                                compiled_languages=compiled_languages,
-                                log_color=self._get_project_color(project_index),
-                            )
+                for (folder, project_name), (
+                    non_compiled_languages,
+                    compiled_languages,
+                ) in zip(folder_candidates, folder_languages):
+                    # Skip if no supported languages are detected
+                    if not non_compiled_languages and not compiled_languages:
+                        self._logger.debug(
+                            "Skipping project %s - no supported languages detected",
+                            project_name,
+                        )
+                        continue
+
+                    projects.append(
+                        ProjectInfo(
+                            repository_path=request.repository_path,
+                            project_path=folder,
+                            build_mode="none",
+                            build_script=None,
+                            queries=[],
+                            name=project_name,
+                            non_compiled_languages=non_compiled_languages,
+                            compiled_languages=compiled_languages,
+                            log_color=self._get_project_color(project_index),
                         )
-                        project_index += 1
+                    )
+                    project_index += 1
         else:
             project_name = (
                 request.repository_path.name or request.repository_path.resolve().name
             )
 
             # Detect languages first
-            non_compiled_languages = self._detect_languages(
-                request.repository_path, LanguageType.NON_COMPILED
-            )
-            compiled_languages = self._detect_languages(
-                request.repository_path, LanguageType.COMPILED
+            non_compiled_languages, compiled_languages = self._detect_languages(
+                request.repository_path
             )
 
             if request.only_changed_files:
@@ -553,11 +610,44 @@ class CodeQLAnalysisUseCase:
 
         return projects
 
+    def _get_changed_paths(self, changed_files: List[str]) -> Set[str]:
+        """Index changed files by every directory that contains them.
+
+        Args:
+            changed_files: Changed file paths, relative to the repository root
+
+        Returns:
+            The changed files and all of their parent directories, without
+            trailing slashes
+        """
+        changed_paths: Set[str] = set()
+        for changed_file in changed_files:
+            changed_file = changed_file.rstrip("/")
+            changed_paths.add(changed_file)
+            separator = changed_file.find("/")
+            while separator != -1:
+                changed_paths.add(changed_file[:separator])
+                separator = changed_file.find("/", separator + 1)
+        return changed_paths
+
     def _project_has_changed_files(
-        self, project_path: Path, repository_root_path: Path, changed_files: List[str]
+        self,
+        project_path: Path,
+        repository_root_path: Path,
+        changed_paths: AbstractSet[str],
     ) -> bool:
-        """Check if a project contains any of the changed files."""
-        if not changed_files:
+        """Check if a project contains any of the changed files.
+
+        Args:
+            project_path: Path of the project
+            repository_root_path: Root of the repository the project is in
+            changed_paths: Changed files and their parent directories, as
+                returned by _get_changed_paths
+
+        Returns:
+            True if a changed file is within the project directory
+        """
+        if not changed_paths:
             return False
 
         # Resolve both paths to absolute paths to avoid relative path issues
@@ -579,70 +669,72 @@ class CodeQLAnalysisUseCase:
         # Normalize project prefix (remove trailing slashes)
         project_prefix = project_prefix.rstrip("/")
 
-        # Check if any changed file is within this project
-        for changed_file in changed_files:
-            # Normalize changed file path
-            changed_file = changed_file.rstrip("/")
+        # Root project matches all files
+        if project_prefix == "." or project_prefix == "":
+            return True
 
-            # Root project matches all files
-            if project_prefix == "." or project_prefix == "":
-                return True
+        # The project is either a changed file or one of their parents
+        return project_prefix in changed_paths
 
-            # Check if file is within project directory
-            if (
-                changed_file.startswith(f"{project_prefix}/")
-                or changed_file == project_prefix
-            ):
-                return True
+    def _detect_projects_languages(
+        self, project_paths: List[Path]
+    ) -> List[Tuple[Set[CodeQLLanguage], Set[CodeQLLanguage]]]:
+        """
+        Detect the non-compiled and compiled languages of several projects.
 
-        return False
+        Projects are scanned in parallel threads: the scan is dominated by
+        directory reads, which release the GIL.
 
-    def _detect_languages(
-        self, repository_path: Path, languageType: LanguageType
-    ) -> Set[CodeQLLanguage]:
-        # Convert language detector results to our domain entities
-        detected_languages = set()
+        Returns:
+            (non_compiled_languages, compiled_languages) for each project,
+            in the order of project_paths
+        """
+        if not project_paths:
+            return []
 
-        # Detect both compiled and non-compiled languages
-        all_languages = self._language_detector.detect_all_languages(repository_path)
+        def detect(
+            project_path: Path,
+        ) -> Tuple[Set[CodeQLLanguage], Set[CodeQLLanguage]]:
+            # Walk each project serially so that this pool is the only one
+            return self._detect_languages(project_path, parallel=False)
 
-        # Map detected languages to CodeQL languages
-        language_mapping = {
-            "javascript": CodeQLLanguage.JAVASCRIPT,
-            "typescript": CodeQLLanguage.TYPESCRIPT,
-            "python": CodeQLLanguage.PYTHON,
-            "java": CodeQLLanguage.JAVA,
-            "csharp": CodeQLLanguage.CSHARP,
-            "cpp": CodeQLLanguage.CPP,
-            "go": CodeQLLanguage.GO,
-            "ruby": CodeQLLanguage.RUBY,
-            "swift": CodeQLLanguage.SWIFT,
-            "actions": CodeQLLanguage.ACTIONS,
-        }
+        # Leave a quarter of the CPUs to the rest of the system
+        max_workers = min(len(project_paths), max(1, 3 * get_cpu_count() // 4))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(detect, project_paths))
 
-        # Define which languages are compiled vs non-compiled
-        compiled_languages = {"java", "csharp", "cpp", "swift"}
-        non_compiled_languages = {
-            "javascript",
-            "typescript",
-            "python",
-            "go",
-            "ruby",
-            "actions",
-        }
+    def _detect_languages(
+        self, repository_path: Path, parallel: bool = True
+    ) -> Tuple[Set[CodeQLLanguage], Set[CodeQLLanguage]]:
+        """Detect the non-compiled and compiled languages of a project.
 
-        target_language_set = (
-            compiled_languages
-            if languageType == LanguageType.COMPILED
-            else non_compiled_languages
-        )
+        The project is scanned once and the result split by language type.
 
-        for lang_list in all_languages.values():
-            for lang in lang_list:
-                if lang in language_mapping and lang in target_language_set:
-                    detected_languages.add(language_mapping[lang])
+        Args:
+            repository_path: Directory of the project
+            parallel: Whether the language detector may walk subdirectories
+                in its own thread pool
+
+        Returns:
+            (non_compiled_languages, compiled_languages)
+        """
+        # Detect both compiled and non-compiled languages
+        all_languages = self._language_detector.detect_all_languages(
+            repository_path, parallel=parallel
+        )
+        detected = all_languages["non_compiled"] | all_languages["compiled"]
 
-        return detected_languages
+        # Convert language detector results to our domain entities
+        return (
+            {
+                self.LANGUAGE_MAPPING[lang]
+                for lang in detected & self.NON_COMPILED_LANGUAGES
+            },
+            {
+                self.LANGUAGE_MAPPING[lang]
+                for lang in detected & self.COMPILED_LANGUAGES
+            },
+        )
 
     def _verify_codeql_installation(
         self, force_install: bool = False
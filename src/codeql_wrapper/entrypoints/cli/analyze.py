@@ -10,7 +10,6 @@ from ...domain.use_cases.codeql_analysis_use_case import CodeQLAnalysisUseCase
 from ...domain.use_cases.sarif_upload_use_case import SarifUploadUseCase
 from ...domain.entities.codeql_analysis import (
     CodeQLAnalysisRequest,
-    CodeQLLanguage,
     RepositoryAnalysisSummary,
     SarifUploadRequest,
     SarifUploadResult,
@@ -156,23 +155,10 @@ def analyze(
     def _parse_languages(languages: Optional[str]) -> set:
         target_languages = set()
         if languages:
-            language_mapping = {
-                "javascript": CodeQLLanguage.JAVASCRIPT,
-                "typescript": CodeQLLanguage.TYPESCRIPT,
-                "python": CodeQLLanguage.PYTHON,
-                "java": CodeQLLanguage.JAVA,
-                "csharp": CodeQLLanguage.CSHARP,
-                "cpp": CodeQLLanguage.CPP,
-                "go": CodeQLLanguage.GO,
-                "ruby": CodeQLLanguage.RUBY,
-                "swift": CodeQLLanguage.SWIFT,
-                "actions": CodeQLLanguage.ACTIONS,
-            }
-
             for lang in languages.split(","):
                 lang = lang.strip().lower()
-                if lang in language_mapping:
-                    target_languages.add(language_mapping[lang])
+                if lang in CodeQLAnalysisUseCase.LANGUAGE_MAPPING:
+                    target_languages.add(CodeQLAnalysisUseCase.LANGUAGE_MAPPING[lang])
                 else:
                     logger.warning(f"Unsupported language: {lang}")
         return target_languages
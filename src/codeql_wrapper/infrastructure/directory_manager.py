@@ -29,6 +29,8 @@ class DirectoryManager:
         """
         self.logger = get_logger(__name__)
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        # Result of _is_git_repository, which spawns git
+        self._git_repository: Optional[bool] = None
 
     def list_all_directories(
         self, exclude_hidden: bool = True, max_depth: int = 1
@@ -142,7 +144,7 @@ class DirectoryManager:
                             if not exclude_hidden or not top_dir.startswith("."):
                                 changed_dirs.add(top_dir)
 
-            result = sorted(list(changed_dirs))
+            result = sorted(changed_dirs)
             self.logger.info(f"Found {len(result)} directories with changes: {result}")
             return result
 
@@ -166,20 +168,26 @@ class DirectoryManager:
         """
         Check if the current directory is in a git repository.
 
+        The answer is cached for the lifetime of the instance.
+
         Returns:
             True if in a git repository, False otherwise
         """
+        if self._git_repository is not None:
+            return self._git_repository
+
         try:
             result = subprocess.run(
                 ["git", "rev-parse", "--git-dir"],
                 cwd=self.base_path,
                 capture_output=True,
                 text=True,
-                check=True,
+                check=False,
             )
-            return result.returncode == 0
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+            self._git_repository = result.returncode == 0
+        except FileNotFoundError:
+            self._git_repository = False
+        return self._git_repository
 
     def _determine_base_commit(
         self,
@@ -224,40 +232,43 @@ class DirectoryManager:
         Returns:
             List of changed file paths
         """
-        try:
-            result = self._run_git_command(["diff", base_ref, "HEAD", "--name-only"])
-
-            # Filter out empty lines
-            changed_files = [
-                line.strip() for line in result.stdout.splitlines() if line.strip()
-            ]
-            return changed_files
-
-        except subprocess.CalledProcessError:
+        result = self._run_git_command(
+            ["diff", base_ref, "HEAD", "--name-only"], check=False
+        )
+        if result.returncode != 0:
             # If git diff fails, return empty list
             self.logger.warning(
                 f"Could not get diff for {base_ref}, returning empty list"
             )
             return []
 
-    def _run_git_command(self, args: List[str]) -> subprocess.CompletedProcess:
+        # Filter out empty lines
+        changed_files = [
+            line.strip() for line in result.stdout.splitlines() if line.strip()
+        ]
+        return changed_files
+
+    def _run_git_command(
+        self, args: List[str], check: bool = True
+    ) -> subprocess.CompletedProcess:
         """
         Run a git command in the base directory.
 
         Args:
             args: Git command arguments
+            check: Whether to raise if the command fails
 
         Returns:
             Completed process result
 
         Raises:
-            subprocess.CalledProcessError: If git command fails
+            subprocess.CalledProcessError: If git command fails and check is True
         """
         cmd = ["git"] + args
         self.logger.debug(f"Running git command: {' '.join(cmd)}")
 
         return subprocess.run(
-            cmd, cwd=self.base_path, capture_output=True, text=True, check=True
+            cmd, cwd=self.base_path, capture_output=True, text=True, check=check
         )
 
     def get_directory_info(self, include_changed: bool = False) -> dict:
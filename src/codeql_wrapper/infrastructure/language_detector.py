@@ -1,10 +1,28 @@
 """Language detector infrastructure module."""
 
+import functools
+import itertools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Set
+from types import MappingProxyType
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from enum import Enum
 
 from .logger import get_logger
+from .system_resource_manager import get_cpu_count
 
 
 class LanguageType(Enum):
@@ -14,17 +32,81 @@ class LanguageType(Enum):
     COMPILED = 1
 
 
+class _ExtensionCollector:
+    """
+    Thread-safe set of found extensions that knows when to stop scanning.
+
+    Scanning is done once the extensions found cover every wanted language.
+    """
+
+    def __init__(
+        self,
+        extension_languages: Mapping[str, Tuple[str, LanguageType]],
+        wanted_languages: FrozenSet[str],
+    ) -> None:
+        self.extensions: Set[str] = set()
+        self._extension_languages = extension_languages
+        self._missing_languages = set(wanted_languages)
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+
+    @property
+    def done(self) -> bool:
+        """Whether every wanted language has been found."""
+        return self._done.is_set()
+
+    def add(self, extensions: Set[str]) -> None:
+        """Record extensions found by a scan."""
+        with self._lock:
+            for extension in extensions - self.extensions:
+                self.extensions.add(extension)
+                language, _ = self._extension_languages[extension]
+                self._missing_languages.discard(language)
+            if not self._missing_languages:
+                self._done.set()
+
+
 class LanguageDetector:
     """Detects programming languages in a directory based on file extensions."""
 
-    def __init__(self) -> None:
-        """Initialize the language detector."""
-        self.logger = get_logger(__name__)
+    # Minimum number of top-level subdirectories to walk them in parallel;
+    # below this the thread pool costs more than it saves
+    PARALLEL_SCAN_MIN_DIRECTORIES = 4
+
+    # Directories holding VCS data, dependencies, environments or build
+    # output; they add nothing to language detection and are not descended
+    IGNORED_DIRECTORIES = frozenset(
+        {
+            ".git",
+            "node_modules",
+            "vendor",
+            "target",
+            "build",
+            "dist",
+            "__pycache__",
+            ".tox",
+            ".venv",
+            "venv",
+            ".mypy_cache",
+            ".pytest_cache",
+        }
+    )
+
+    # Hidden directories that are still scanned when hidden directories are
+    # skipped
+    HIDDEN_DIRECTORY_EXCEPTIONS = frozenset({".github"})
+
+    # Deepest directory level below the target directory that is scanned
+    MAX_SCAN_DEPTH = 20
+
+    # Number of directories whose detect_all_languages results are cached
+    DETECTION_CACHE_SIZE = 128
 
-        # Define language mappings based on file extensions
-        # Following CodeQL Action's exact language mapping from languages.ts
-        # Non-compiled languages (interpreted/transpiled)
-        self._non_compiled_extensions = {
+    # Define language mappings based on file extensions
+    # Following CodeQL Action's exact language mapping from languages.ts
+    # Non-compiled languages (interpreted/transpiled)
+    NON_COMPILED_EXTENSIONS: Mapping[str, str] = MappingProxyType(
+        {
             # JavaScript (includes TypeScript - CodeQL treats them identically)
             # Note: TypeScript is treated as JavaScript in CodeQL Action
             # Note: JSX, Flow, HTML, and other web-related files are analyzed with JavaScript
@@ -59,9 +141,11 @@ class LanguageDetector:
             # Note: Features from nightly toolchains are not supported
             "rs": "rust",
         }
+    )
 
-        # Compiled languages (traced languages in CodeQL Action)
-        self._compiled_extensions = {
+    # Compiled languages (traced languages in CodeQL Action)
+    COMPILED_EXTENSIONS: Mapping[str, str] = MappingProxyType(
+        {
             # C/C++ (C89-C23, C++98-C++23)
             # Note: C++20 modules are not supported
             # Note: C23 and C++23 support is currently in beta
@@ -101,24 +185,76 @@ class LanguageDetector:
             # Note: Support for the analysis of Swift requires macOS
             "swift": "swift",
         }
+    )
+
+    # Both mappings merged, so each extension is looked up only once
+    EXTENSION_LANGUAGES: Mapping[str, Tuple[str, LanguageType]] = MappingProxyType(
+        {
+            **{
+                extension: (language, LanguageType.NON_COMPILED)
+                for extension, language in NON_COMPILED_EXTENSIONS.items()
+            },
+            **{
+                extension: (language, LanguageType.COMPILED)
+                for extension, language in COMPILED_EXTENSIONS.items()
+            },
+        }
+    )
+
+    def __init__(self, include_hidden_directories: bool = False) -> None:
+        """
+        Initialize the language detector.
+
+        Args:
+            include_hidden_directories: Whether to scan directories whose
+                name starts with a dot, other than HIDDEN_DIRECTORY_EXCEPTIONS
+        """
+        self.logger = get_logger(__name__)
+        self.include_hidden_directories = include_hidden_directories
+        # Per instance, so the cache does not keep detectors alive
+        self._detect_cached = functools.lru_cache(maxsize=self.DETECTION_CACHE_SIZE)(
+            self._detect_all_languages
+        )
 
     # Public methods first
-    def detect_all_languages(self, target_dir: Path) -> dict:
+    def detect_all_languages(
+        self, target_dir: Path, parallel: bool = True
+    ) -> Dict[str, FrozenSet[str]]:
         """
         Detect both compiled and non-compiled languages in a directory.
 
+        The directory is walked once and both language types are derived
+        from the extensions found. Results are cached per directory and
+        reused while the modification times of the directory and of its
+        direct children are unchanged; call clear_cache() after changes
+        deeper in the tree.
+
         Args:
             target_dir: Directory to scan for language files
+            parallel: Whether subdirectories may be walked in a thread pool;
+                callers that already scan several directories in parallel
+                should pass False to avoid nesting thread pools
 
         Returns:
-            Dictionary with 'compiled' and 'non_compiled' keys containing language lists
+            Dictionary with 'compiled' and 'non_compiled' keys containing
+            frozensets of languages
+
+        Raises:
+            FileNotFoundError: If target directory doesn't exist
+            PermissionError: If target directory is not accessible
         """
-        return {
-            "non_compiled": self.detect_languages(
-                target_dir, LanguageType.NON_COMPILED
-            ),
-            "compiled": self.detect_languages(target_dir, LanguageType.COMPILED),
-        }
+        real_path = os.path.realpath(target_dir)
+        fingerprint = self._get_fingerprint(real_path)
+        if fingerprint is None:
+            # Let the walk report why the directory cannot be scanned
+            return self._detect_all_languages(str(target_dir), 0, parallel)
+
+        # Copy so that callers cannot change the cached dictionary
+        return dict(self._detect_cached(real_path, fingerprint, parallel))
+
+    def clear_cache(self) -> None:
+        """Forget the results cached by detect_all_languages."""
+        self._detect_cached.cache_clear()
 
     def detect_languages(
         self, target_dir: Path, language_type: LanguageType
@@ -137,56 +273,249 @@ class LanguageDetector:
             FileNotFoundError: If target directory doesn't exist
             PermissionError: If target directory is not accessible
         """
+        extensions = self._collect_extensions(target_dir, [language_type])
+        languages = self._get_languages(extensions, target_dir, [language_type])
+        return sorted(languages[language_type])
+
+    def should_scan_directory(self, name: str) -> bool:
+        """
+        Check whether a subdirectory with this name should be scanned.
+
+        Args:
+            name: Name of the subdirectory
+
+        Returns:
+            False for IGNORED_DIRECTORIES and, unless hidden directories are
+            included, for hidden ones other than HIDDEN_DIRECTORY_EXCEPTIONS
+        """
+        if name in self.IGNORED_DIRECTORIES:
+            return False
+        if name.startswith(".") and not self.include_hidden_directories:
+            return name in self.HIDDEN_DIRECTORY_EXCEPTIONS
+        return True
+
+    # Private methods last
+    def _detect_all_languages(
+        self, target_dir: str, fingerprint: int, parallel: bool
+    ) -> Dict[str, FrozenSet[str]]:
+        """
+        Walk a directory for detect_all_languages.
+
+        Args:
+            target_dir: Directory to scan for language files
+            fingerprint: Cache key only, see _get_fingerprint
+            parallel: Whether subdirectories may be walked in a thread pool
 
+        Returns:
+            Dictionary with 'compiled' and 'non_compiled' keys containing
+            frozensets of languages
+        """
+        extensions = self._collect_extensions(Path(target_dir), LanguageType, parallel)
+        languages = self._get_languages(extensions, target_dir)
+        return {
+            "non_compiled": languages[LanguageType.NON_COMPILED],
+            "compiled": languages[LanguageType.COMPILED],
+        }
+
+    def _get_fingerprint(self, directory: str) -> Optional[int]:
+        """
+        Get the latest modification time of a directory and its direct children.
+
+        Args:
+            directory: Directory to fingerprint
+
+        Returns:
+            Modification time in nanoseconds, or None if the directory
+            cannot be listed
+        """
+        try:
+            fingerprint = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    fingerprint = max(
+                        fingerprint, entry.stat(follow_symlinks=False).st_mtime_ns
+                    )
+        except OSError:
+            return None
+        return fingerprint
+
+    def _scan_directory(self, directory: str) -> Tuple[Set[str], List[str]]:
+        """
+        List one directory with os.scandir.
+
+        File types come from the directory listing instead of a stat per
+        entry, and no Path object is built per file. Only entries with a
+        known extension are checked to be files, so symlinks and
+        filesystems without type information cost a stat only for those.
+        Like Path.rglob, symlinked directories are not followed.
+        IGNORED_DIRECTORIES, and hidden directories unless they are
+        included, are not returned.
+
+        Args:
+            directory: Directory to list
+
+        Returns:
+            Tuple of (known file extensions, lowercase and without the dot;
+            subdirectory paths)
+
+        Raises:
+            PermissionError: If the directory is not accessible
+        """
+        extensions: Set[str] = set()
+        subdirectories: List[str] = []
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if self.should_scan_directory(entry.name):
+                        subdirectories.append(entry.path)
+                    continue
+                # Get file extension (without the dot), as Path.suffix would:
+                # names without a dot or starting with their only dot have none
+                stem, _, extension = entry.name.rpartition(".")
+                if not stem:
+                    continue
+                extension = extension.lower()
+                if extension in self.EXTENSION_LANGUAGES and entry.is_file():
+                    extensions.add(extension)
+        return extensions, subdirectories
+
+    def _scan_tree(
+        self, directory: str, collector: _ExtensionCollector, depth: int = 1
+    ) -> None:
+        """
+        Collect the file extensions in a directory tree.
+
+        Subdirectories that cannot be read are skipped, as Path.rglob does,
+        and so are those deeper than MAX_SCAN_DEPTH. The walk stops as soon
+        as the collector has found every wanted language, including through
+        other threads.
+
+        Args:
+            directory: Root of the tree
+            collector: Collector receiving the extensions found
+            depth: Depth of the root below the target directory
+        """
+        seen: Set[str] = set()
+        pending = [(directory, depth)]
+        while pending and not collector.done:
+            directory, depth = pending.pop()
+            try:
+                found, subdirectories = self._scan_directory(directory)
+            except PermissionError:
+                continue
+            # Only take the collector's lock when something new turns up
+            if not found <= seen:
+                seen |= found
+                collector.add(found)
+            if depth < self.MAX_SCAN_DEPTH:
+                pending.extend((path, depth + 1) for path in subdirectories)
+
+    def _collect_extensions(
+        self,
+        target_dir: Path,
+        language_types: Iterable[LanguageType],
+        parallel: bool = True,
+    ) -> Set[str]:
+        """
+        Collect the file extensions present in a directory, recursively.
+
+        When the directory has enough subdirectories, they are walked in
+        parallel threads: os.scandir releases the GIL while reading
+        directories, which dominates the walk on large trees. Scanning stops
+        early once every language of the requested types has been found.
+
+        Args:
+            target_dir: Directory to scan for language files
+            language_types: Types of the languages being detected
+            parallel: Whether subdirectories may be walked in a thread pool
+
+        Returns:
+            Known file extensions, lowercase and without the dot
+
+        Raises:
+            FileNotFoundError: If target directory doesn't exist
+            PermissionError: If target directory is not accessible
+        """
         if not target_dir.exists():
             raise FileNotFoundError(f"Target directory does not exist: {target_dir}")
 
         if not target_dir.is_dir():
             raise ValueError(f"Target path is not a directory: {target_dir}")
 
-        self.logger.info(
-            f"Detecting {language_type.name.lower()} languages in: {target_dir}"
-        )
+        self.logger.info("Detecting languages in: %s", target_dir)
 
-        detected_languages: Set[str] = set()
+        types = set(language_types)
+        collector = _ExtensionCollector(
+            self.EXTENSION_LANGUAGES,
+            frozenset(
+                language
+                for language, language_type in self.EXTENSION_LANGUAGES.values()
+                if language_type in types
+            ),
+        )
 
         try:
-            for file_path in target_dir.rglob("*"):
-                if file_path.is_file():
-                    language = self._get_language_from_file(file_path, language_type)
-                    if language:
-                        detected_languages.add(language)
+            found, subdirectories = self._scan_directory(os.fspath(target_dir))
         except PermissionError as e:
             self.logger.error(f"Permission denied accessing directory: {e}")
             raise
+        collector.add(found)
 
-        # Sort and return as list
-        result = sorted(list(detected_languages))
-        self.logger.info(f"Detected languages: {result}")
-        return result
+        if not parallel or len(subdirectories) < self.PARALLEL_SCAN_MIN_DIRECTORIES:
+            for subdirectory in subdirectories:
+                self._scan_tree(subdirectory, collector)
+        else:
+            max_workers = min(len(subdirectories), get_cpu_count())
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Consume the results so that scan errors are raised here
+                list(
+                    executor.map(
+                        self._scan_tree,
+                        subdirectories,
+                        itertools.repeat(collector),
+                    )
+                )
 
-    # Private methods last
-    def _get_language_from_file(
-        self, file_path: Path, language_type: LanguageType
-    ) -> str:
+        return collector.extensions
+
+    def _get_languages(
+        self,
+        extensions: Set[str],
+        target_dir: Union[str, Path],
+        language_types: Iterable[LanguageType] = LanguageType,
+    ) -> Dict[LanguageType, FrozenSet[str]]:
         """
-        Get the language for a file based on its extension and type filter.
+        Get the languages a set of extensions maps to, by language type.
 
         Args:
-            file_path: Path to the file
-            language_type: Type of languages to consider
+            extensions: Lowercase file extensions, without the dot
+            target_dir: Directory the extensions were found in, for logging
+            language_types: Types that were detected and are logged; a scan
+                for some types can stop before the others are all found
 
         Returns:
-            Language name if detected, empty string otherwise
+            Dictionary mapping each language type to its detected languages
         """
-        # Get file extension (without the dot)
-        extension = file_path.suffix.lstrip(".").lower()
-
-        if language_type == LanguageType.NON_COMPILED:
-            result = self._non_compiled_extensions.get(extension)
-            return result if result is not None else ""
-        elif language_type == LanguageType.COMPILED:
-            result = self._compiled_extensions.get(extension)
-            return result if result is not None else ""
+        detected_languages: Dict[LanguageType, Set[str]] = {
+            language_type: set() for language_type in LanguageType
+        }
+        for extension in extensions:
+            match = self.EXTENSION_LANGUAGES.get(extension)
+            if match:
+                language, language_type = match
+                detected_languages[language_type].add(language)
 
-        return ""
+        result = {
+            language_type: frozenset(languages)
+            for language_type, languages in detected_languages.items()
+        }
+        # Sorting only matters for the log message
+        if self.logger.isEnabledFor(logging.INFO):
+            for language_type in language_types:
+                self.logger.info(
+                    "Detected %s languages in %s: %s",
+                    language_type.name.lower(),
+                    target_dir,
+                    sorted(result[language_type]),
+                )
+        return result
@@ -1,8 +1,9 @@
 """Logging infrastructure for the CodeQL wrapper application."""
 
+import functools
 import logging
 import sys
-from typing import Optional
+from typing import Dict, Optional
 from contextvars import ContextVar
 
 # Context variable to store the current project path
@@ -15,44 +16,60 @@ current_log_color: ContextVar[Optional[str]] = ContextVar(
     "current_log_color", default=None
 )
 
-# Context variable to store the current log format
-current_format: ContextVar[Optional[str]] = ContextVar(
-    "current_format", default="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
+# Log format outside of a project context
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Log format inside a project context
+PROJECT_FORMAT = "%(asctime)s - %(name)s - %(project)s - %(levelname)s - %(message)s"
 
 
 class ShortNameFormatter(logging.Formatter):
-    """Custom formatter that shows only the class name instead of full module path."""
+    """
+    Custom formatter that shows only the class name instead of full module path.
+
+    Records logged inside a project context are formatted with a second,
+    pre-built formatter that includes the project, so no format string is
+    swapped per record.
+    """
+
+    # Short names by full logger name; there are only a handful of loggers
+    _short_names: Dict[str, str] = {}
+
+    def __init__(
+        self, fmt: Optional[str] = None, project_fmt: Optional[str] = None
+    ) -> None:
+        """
+        Initialize the formatter.
+
+        Args:
+            fmt: Format for records outside of a project context
+            project_fmt: Format for records inside a project context
+        """
+        super().__init__(fmt or DEFAULT_FORMAT)
+        self._project_formatter = logging.Formatter(project_fmt or PROJECT_FORMAT)
 
     def format(self, record: logging.LogRecord) -> str:
         # Extract just the class name from the full module path
-        if "." in record.name:
-            record.name = record.name.split(".")[-1]
+        short_name = self._short_names.get(record.name)
+        if short_name is None:
+            short_name = record.name.rpartition(".")[2]
+            self._short_names[record.name] = short_name
+        record.name = short_name
 
         # Add project field - use context if not explicitly set
-        project_value = current_project_context.get() or ""
-        if not hasattr(record, "project"):
+        project_value = getattr(record, "project", None)
+        if project_value is None:
+            project_value = current_project_context.get() or ""
             record.project = project_value
 
         # Get the log color from context if available
         log_color = getattr(record, "log_color", None) or current_log_color.get()
 
-        # Get the current format from context and update the formatter
-        # If no specific format is set, determine format based on project context
-        current_fmt = current_format.get()
-        if current_fmt is None:
-            if project_value:
-                current_fmt = (
-                    "%(asctime)s - %(name)s - %(project)s - %(levelname)s - %(message)s"
-                )
-            else:
-                current_fmt = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-
-        if current_fmt and current_fmt != self._style._fmt:
-            self._style._fmt = current_fmt
-
-        # Format the message with the parent formatter
-        formatted_message = super().format(record)
+        # Format the message with the formatter matching the project context
+        if project_value:
+            formatted_message = self._project_formatter.format(record)
+        else:
+            formatted_message = super().format(record)
 
         # Apply color if available
         if log_color:
@@ -62,12 +79,16 @@ class ShortNameFormatter(logging.Formatter):
         return formatted_message
 
 
+@functools.lru_cache(maxsize=None)
 def get_logger(
     name: str, level: Optional[int] = None, format_string: Optional[str] = None
 ) -> logging.Logger:
     """
     Get a configured logger instance.
 
+    Results are memoized per arguments: a logger is configured once, so later
+    calls skip the locked logging.getLogger lookup.
+
     Args:
         name: Logger name (usually __name__)
         level: Logging level (if None, inherits from root logger)
@@ -89,10 +110,6 @@ def get_logger(
         # Let the logger inherit from root logger (which is configured by configure_logging)
         logger.setLevel(logging.NOTSET)
 
-    # Always use our custom formatter to ensure colors work
-    if format_string is None:
-        format_string = current_format.get()
-
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
     handler_level = level if level is not None else logger.getEffectiveLevel()
@@ -119,15 +136,11 @@ def set_project_context(project_path: Optional[str]) -> None:
         project_path: The project path to set in context
     """
     current_project_context.set(str(project_path) if project_path else "")
-    current_format.set(
-        "%(asctime)s - %(name)s - %(project)s - %(levelname)s - %(message)s"
-    )
 
 
 def clear_project_context() -> None:
     """Clear the current project context."""
     current_project_context.set("")
-    current_format.set("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
 
 def set_log_color(log_color: Optional[str]) -> None:
@@ -163,7 +176,7 @@ def configure_logging(verbose: bool = False) -> None:
     handler.setLevel(level)
 
     # Use our custom formatter that shows only class names
-    formatter = ShortNameFormatter(current_format.get())
+    formatter = ShortNameFormatter()
 
     handler.setFormatter(formatter)
 
@@ -1,7 +1,8 @@
 """System resource management infrastructure."""
 
 import os
-from typing import Any
+import time
+from typing import Any, Optional, Tuple
 
 # Try to import psutil, fallback gracefully if not available
 try:
@@ -11,13 +12,39 @@ try:
 except ImportError:
     PSUTIL_AVAILABLE = False
 
+# CPUs this process may run on, computed once at import. The affinity mask
+# reflects container and taskset limits where the platform exposes it.
+if hasattr(os, "sched_getaffinity"):
+    _CPU_COUNT = len(os.sched_getaffinity(0)) or 2
+else:
+    _CPU_COUNT = os.cpu_count() or 2
+
+
+def get_cpu_count() -> int:
+    """
+    Get the number of CPUs this process may run on.
+
+    Use this rather than os.cpu_count() to size worker pools, which would
+    count CPUs a container or taskset does not grant.
+
+    Returns:
+        The affinity-aware CPU count, computed once at import
+    """
+    return _CPU_COUNT
+
 
 class SystemResourceManager:
     """Manages system resource detection and worker calculation."""
 
+    # How long a memory reading is reused; it does not change meaningfully
+    # within one planning step
+    MEMORY_CACHE_TTL_SECONDS = 2.0
+
     def __init__(self, logger: Any) -> None:
         """Initialize the system resource manager."""
         self._logger = logger
+        # (available memory in GB, monotonic expiry time)
+        self._memory_cache: Optional[Tuple[float, float]] = None
 
     def get_available_memory_gb(self) -> float:
         """
@@ -27,9 +54,16 @@ class SystemResourceManager:
         without the system going into swap. This is more accurate for resource
         planning than total memory as it accounts for memory already in use.
 
+        Readings are reused for MEMORY_CACHE_TTL_SECONDS.
+
         Returns:
             Available memory in GB. Falls back to 7GB if psutil is unavailable.
         """
+        if self._memory_cache is not None:
+            memory_gb, expires_at = self._memory_cache
+            if time.monotonic() < expires_at:
+                return memory_gb
+
         if not PSUTIL_AVAILABLE:
             self._logger.debug(
                 "psutil not available, using conservative memory estimate"
@@ -37,7 +71,7 @@ class SystemResourceManager:
             return 7.0  # GitHub Actions standard runner
 
         try:
-            return psutil.virtual_memory().available / (1024**3)
+            memory_gb = psutil.virtual_memory().available / (1024**3)
         except Exception as e:
             self._logger.debug(
                 f"Failed to get memory info from psutil: {e}, "
@@ -45,6 +79,12 @@ class SystemResourceManager:
             )
             return 7.0  # Fallback to GitHub Actions standard runner
 
+        self._memory_cache = (
+            memory_gb,
+            time.monotonic() + self.MEMORY_CACHE_TTL_SECONDS,
+        )
+        return memory_gb
+
     def calculate_optimal_workers(self) -> int:
         """
         Calculate optimal number of workers based on system resources.
@@ -57,7 +97,7 @@ class SystemResourceManager:
         """
         try:
             # Get system specifications
-            cpu_count = os.cpu_count() or 2
+            cpu_count = get_cpu_count()
             memory_gb = self.get_available_memory_gb()
 
             # Conservative calculation for CodeQL analysis